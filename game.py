@@ -1,9 +1,10 @@
 import os
 import sys
 import pygame
+import threading
 import random
 import settings as s
-from sprites import SpriteSheet, Platform, Player, Base, Cloud, Slime, BackGround, Bullet, Bat
+from sprites import load_img, SpriteSheet, Platform, Player, Base, Cloud, Slime, BackGround, Bullet, Bat
 
 
 class CoronaBreakout:
@@ -19,12 +20,17 @@ class CoronaBreakout:
         pygame.display.set_caption(s.TITLE)
 
         self.clock = pygame.time.Clock()
+        self.clear_image = pygame.Surface((s.WIDTH, s.HEIGHT)).convert()  # black
         self.font_name = pygame.font.match_font(s.FONT_NAME)
         self.paused = False
         self.running = True
         self.score = 0
         self.load_data()
 
+        # read animation frames from disk while the start screen is shown
+        self._preloaded = {}
+        threading.Thread(target=self._preload_assets, daemon=True).start()
+
     def load_data(self):
         """Loads all necessary data.
 
@@ -36,6 +42,13 @@ class CoronaBreakout:
         self.sound_dir = os.path.join(self.dir, 'sounds')
         self.comic_dir = os.path.join(self.dir, 'Comic Strips')
 
+        # list the animation frames once, in order, for every new game
+        self.asset_manifest = {}
+        for subdir in s.PLAYER_ANIMS:
+            anim_dir = os.path.join(self.img_dir, subdir)
+            self.asset_manifest[subdir] = tuple(os.path.join(anim_dir, image)
+                                                for image in sorted(os.listdir(anim_dir)))
+
         # load high score
         try:  # if file exists, load data
             with open(os.path.join(self.dir, s.HS_FILE), 'r') as f:
@@ -51,14 +64,65 @@ class CoronaBreakout:
         self.plat_spritesheet = SpriteSheet(os.path.join(self.img_dir, s.PLAT_SPRITESHEET))
         self.bac_spritesheet = SpriteSheet(os.path.join(self.img_dir, s.BAC_SPRITESHEET))
 
+        # load walking frames of slimes and bacteria, along with their masks
+        slime_frames = (
+            self.enemy_spritesheet.get_image(52, 125, 50, 28, scale=1.5),
+            self.enemy_spritesheet.get_image(0, 125, 51, 26, scale=1.5),
+        )
+        bacteria_frames = tuple(self.bac_spritesheet.get_image(x, y, 32, 31, scale=1.5)
+                                for y in (0, 31, 62, 93) for x in (0, 32, 64))
+        self.slime_frames = (slime_frames, tuple(pygame.mask.from_surface(f) for f in slime_frames))
+        self.bacteria_frames = (bacteria_frames, tuple(pygame.mask.from_surface(f) for f in bacteria_frames))
+
+        # load flying frames of bats and boss bats, along with their masks
+        bat_frames = (
+            self.enemy_spritesheet.get_image(0, 32, 72, 36, scale=1.5),
+            self.enemy_spritesheet.get_image(0, 0, 75, 31, scale=1.5),
+        )
+        boss_bat_frames = (
+            self.enemy_spritesheet.get_image(0, 32, 72, 36, scale=2),
+            self.enemy_spritesheet.get_image(0, 0, 75, 31, scale=2),
+        )
+        self.bat_frames = (bat_frames, tuple(pygame.mask.from_surface(f) for f in bat_frames))
+        self.boss_bat_frames = (boss_bat_frames, tuple(pygame.mask.from_surface(f) for f in boss_bat_frames))
+
+        # load platform images of every level
+        self.platform_images = {
+            1: (  # stone platforms
+                self.plat_spritesheet.get_image(0, 96, 380, 94),
+                self.plat_spritesheet.get_image(0, 192, 380, 94),
+                self.plat_spritesheet.get_image(382, 408, 200, 100),
+                self.plat_spritesheet.get_image(232, 1288, 200, 100),
+            ),
+            2: (  # rock platforms
+                self.plat_spritesheet.get_image(0, 960, 380, 94),
+                self.plat_spritesheet.get_image(0, 864, 380, 94),
+                self.plat_spritesheet.get_image(218, 1558, 200, 100),
+                self.plat_spritesheet.get_image(382, 0, 200, 100),
+            ),
+            3: (  # grass platforms
+                self.plat_spritesheet.get_image(0, 288, 380, 94),
+                self.plat_spritesheet.get_image(0, 384, 380, 94),
+                self.plat_spritesheet.get_image(213, 1662, 201, 100),
+                self.plat_spritesheet.get_image(382, 204, 200, 100),
+            ),
+            4: (  # snow platforms
+                self.plat_spritesheet.get_image(0, 768, 380, 94),
+                self.plat_spritesheet.get_image(0, 480, 380, 94),
+                self.plat_spritesheet.get_image(213, 1764, 201, 100),
+                self.plat_spritesheet.get_image(384, 306, 200, 100),
+            ),
+        }
+
         # load base image
-        self.base_img = pygame.image.load(os.path.join(self.img_dir, 'grassCenter.png')).convert()
+        self.base_img = load_img(os.path.join(self.img_dir, 'grassCenter.png'))
 
         # load virus image
-        virus_image = pygame.image.load(os.path.join(self.img_dir, 'coronavirus.png')).convert()
-        rect = virus_image.get_rect()
-        self.virus_image = pygame.transform.scale(virus_image, (rect.width * 2, rect.height * 2))
-        self.virus_image.set_colorkey(s.BLACK)
+        self.virus_image = load_img(os.path.join(self.img_dir, 'coronavirus.png'), 2)
+
+        # load vaccine image
+        image = load_img(os.path.join(self.img_dir, 'syringe.png'), 2)
+        self.vaccine_img = pygame.transform.rotate(image, 90)
 
         # load pause screen image
         image = pygame.image.load(os.path.join(self.img_dir, 'pausescreen.jpg')).convert()
@@ -76,11 +140,13 @@ class CoronaBreakout:
         image = pygame.image.load(os.path.join(self.img_dir, 'mis_success.jpg')).convert()
         self.mis_completed_img = pygame.transform.scale(image, (s.WIDTH, s.HEIGHT))
 
-        # load cloud images
-        self.cloud_images = []
+        # load cloud images, pre-scaled to every cloud size
+        cloud_variants = []
         cloud_dir = os.path.join(self.img_dir, 'clouds')
         for i in range(1, 4):
-            self.cloud_images.append(pygame.image.load(os.path.join(cloud_dir, f'cloud{i}.png')).convert())
+            image = pygame.image.load(os.path.join(cloud_dir, f'cloud{i}.png'))
+            cloud_variants.extend(load_img(image, scale) for scale in s.CLOUD_SCALES)
+        self.cloud_variants = tuple(cloud_variants)
 
         # load comic strips
         self.comic_strips = []
@@ -95,6 +161,17 @@ class CoronaBreakout:
         self.dead_sound = pygame.mixer.Sound(os.path.join(self.sound_dir, 'dead.wav'))
         self.bullet_sound = pygame.mixer.Sound(os.path.join(self.sound_dir, 'bullet.wav'))
 
+    def _preload_assets(self):
+        """Loads the raw player animation frames, on a worker thread.
+
+        Frames are stored in self._preloaded, keyed by path, as soon as
+        each one is loaded. They are converted later on the main thread.
+        """
+
+        for paths in self.asset_manifest.values():
+            for path in paths:
+                self._preloaded[path] = pygame.image.load(path)
+
     def new(self):
         """Start a new game.
         """
@@ -106,18 +183,31 @@ class CoronaBreakout:
 
         self.failed = False
 
+        # state of the movement keys, tracked through events
+        # seeded here, intro screens swallow the key events
+        keys = pygame.key.get_pressed()
+        self.key_left = bool(keys[pygame.K_LEFT])
+        self.key_right = bool(keys[pygame.K_RIGHT])
+
         # used for checking if player completed game
         self.platforms_crossed = 0
 
         # initialize sprite groups
-        self.all_sprites = pygame.sprite.LayeredUpdates()
+        self.all_sprites = pygame.sprite.LayeredDirty()
+        self.all_sprites.clear(self.screen, self.clear_image)
+        self.all_sprites.repaint_rect(self.screen.get_rect())  # level intro is still shown
+        self._hud_rects = []  # areas covered by the HUD in the last frame
         self.platforms = pygame.sprite.Group()
         self.powerups = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
+        self.slimes = pygame.sprite.Group()
         self.viruses = pygame.sprite.Group()
         self.bullets = pygame.sprite.Group()
         self.clouds = pygame.sprite.Group()
 
+        # platform images of the current level
+        self.platform_imgs = self.platform_images[self.level]
+
         # load bg image
         self.bg_image = BackGround(self)
 
@@ -144,6 +234,8 @@ class CoronaBreakout:
         for plat in s.PLATFORM_START_LIST:
             Platform(self, *plat)
 
+        self.update_ground_rects()
+
         # create clouds/other images
         if self.level == 1:
             for i in range(5):
@@ -186,6 +278,12 @@ class CoronaBreakout:
 
             # escape key to pause
             if event.type == pygame.KEYDOWN:
+                # player movement
+                if event.key == pygame.K_LEFT:
+                    self.key_left = True
+                elif event.key == pygame.K_RIGHT:
+                    self.key_right = True
+
                 # keydown space to jump
                 if event.key == pygame.K_UP:
                     if not self.player.jumping:
@@ -209,6 +307,12 @@ class CoronaBreakout:
                         self.n_bullets -= 1
 
             if event.type == pygame.KEYUP:
+                # player movement
+                if event.key == pygame.K_LEFT:
+                    self.key_left = False
+                elif event.key == pygame.K_RIGHT:
+                    self.key_right = False
+
                 # keyup space to jump_cut
                 if event.key == pygame.K_UP:
                     self.player.jump_cut()
@@ -229,14 +333,13 @@ class CoronaBreakout:
         Main logic of the game.
         """
 
+        # sprites read the time of the current frame from here
+        self.now = pygame.time.get_ticks()
+        now = self.now
+
         # update all sprites
         self.all_sprites.update()
-
-        now = pygame.time.get_ticks()
-
-        # prevent the player from going towards the left
-        if self.player.rect.left <= 0:
-            self.player.rect.right = self.player.rect.width + 10
+        self.update_slimes()
 
         # spawn Slime at level 1, 2, and 3 every 5 secs.
         if now - self.slime_timer > 5000 + random.choice([-1000, -500, 0, 500, 1000]):
@@ -263,6 +366,7 @@ class CoronaBreakout:
             new_base = Base(self, last_base.rect.right, s.HEIGHT - s.BASE_HEIGHT)
             self.bases.append(new_base)
             self.bases.pop(0)
+            self.update_ground_rects()
 
         # player - enemy collision check
         temp_enemy_hits = pygame.sprite.spritecollide(self.player, self.enemies, False)
@@ -316,9 +420,9 @@ class CoronaBreakout:
         if base_hits:
             lowest = base_hits[0]
             # if player below base, make him rest on base
-            if self.player.pos.y > lowest.rect.top:
-                self.player.pos.y = lowest.rect.top + 5
-                self.player.vel.y = 0
+            if self.player.pos_y > lowest.rect.top:
+                self.player.pos_y = lowest.rect.top + 5
+                self.player.vel_y = 0
                 self.player.jumping = False
 
         # player - powerup collision check
@@ -347,17 +451,17 @@ class CoronaBreakout:
                         plat = hit
 
                 # if player is within the platforms's width
-                if self.player.pos.x - self.player.rect.width / 2 < plat.rect.right and \
-                        self.player.pos.x + self.player.rect.width / 2 > plat.rect.left:
+                if self.player.pos_x - self.player.rect.width / 2 < plat.rect.right and \
+                        self.player.pos_x + self.player.rect.width / 2 > plat.rect.left:
                     # if player is above platform, make him rest on platform
-                    if self.player.pos.y < plat.rect.centery:
-                        self.player.pos.y = plat.rect.top + 5  # to compensate for extra space below in image
-                        self.player.vel.y = 0
+                    if self.player.pos_y < plat.rect.centery:
+                        self.player.pos_y = plat.rect.top + 5  # to compensate for extra space below in image
+                        self.player.vel_y = 0
                         self.player.jumping = False
                     # if player is below the platform, and was going/jumping up, restrict his jump
-                    if self.player.pos.y > plat.rect.bottom and self.player.vel.y < 0:
-                        self.player.pos.y = plat.rect.bottom + self.player.rect.height
-                        self.player.vel.y = 0
+                    if self.player.pos_y > plat.rect.bottom and self.player.vel_y < 0:
+                        self.player.pos_y = plat.rect.bottom + self.player.rect.height
+                        self.player.vel_y = 0
                         self.player.jumping = False
         except Exception:
             pass
@@ -368,28 +472,34 @@ class CoronaBreakout:
             if self.level == 1:
                 if random.randrange(100) < s.CLOUD_FREQ:
                     Cloud(self)
-            if self.player.vel.x > 0:
+            if self.player.vel_x > 0:
                 # updating player
-                self.player.pos.x -= max(self.player.vel.x, 3)
+                self.player.pos_x -= max(self.player.vel_x, 3)
                 # updating previous clouds
                 for cloud in self.clouds:
-                    cloud.rect.x -= max(self.player.vel.x / 6, 1)
+                    cloud.rect.x -= max(self.player.vel_x / 6, 1)
+                    cloud.dirty = 1
+                    if cloud.rect.right < 0:
+                        cloud.kill()
                 # updating platforms
                 for plat in self.platforms:
-                    plat.rect.x -= max(self.player.vel.x, 3)
+                    plat.rect.x -= max(self.player.vel_x, 3)
+                    plat.dirty = 1
                     if plat.rect.right <= 0:
                         plat.kill()
                         self.score += 1
                         self.platforms_crossed += 1
                 # updating enemies
                 for enemy in self.enemies:
-                    enemy.rect.x -= max(self.player.vel.x, 3)
+                    enemy.rect.x -= max(self.player.vel_x, 3)
                 # updating viruses
                 for virus in self.viruses:
-                    virus.rect.x -= max(self.player.vel.x, 3)
+                    virus.rect.x -= max(self.player.vel_x, 3)
                 # background
                 if self.level >= 2:
-                    self.bg_image.rect.x -= max(self.player.vel.x / 6, 1)
+                    self.bg_image.rect.x -= max(self.player.vel_x / 6, 1)
+                    self.bg_image.dirty = 1
+                    self.bg_image_2.dirty = 1
 
         # scrolling background
         if self.level >= 2:
@@ -405,10 +515,14 @@ class CoronaBreakout:
                 max_right = plat.rect.right
 
         # create new platforms, max of 3 platforms available at a time.
-        while len(self.platforms) < 3:
-            rand_x = max_right + random.randrange(200, 400)
-            rand_y = s.HEIGHT - 150 - s.BASE_HEIGHT - random.randrange(0, 100, 20)
-            Platform(self, rand_x, rand_y)
+        if len(self.platforms) < 3:
+            while len(self.platforms) < 3:
+                rand_x = max_right + random.randrange(200, 400)
+                rand_y = s.HEIGHT - 150 - s.BASE_HEIGHT - random.randrange(0, 100, 20)
+                Platform(self, rand_x, rand_y)
+
+            # platforms are only killed by scrolling, right before this
+            self.update_ground_rects()
 
         # check if gameover
         if self.platforms_crossed >= s.PLAT_CROSS:
@@ -418,29 +532,64 @@ class CoronaBreakout:
                 self.failed = True
                 self.show_failed_screen()
 
+    def update_slimes(self):
+        """Moves and animates all slimes.
+
+        Done here in one loop, instead of an update call per Slime.
+        Slimes out of the screen are killed.
+        """
+
+        now = self.now
+
+        for slime in self.slimes.sprites():
+            rect = slime.rect
+            rect.x -= slime.vx
+
+            if rect.right < 0:
+                slime.kill()
+            elif now - slime.last_update > 180:
+                slime.last_update = now
+                slime.current_frame = (slime.current_frame + 1) % len(slime.walk_images)
+                slime.image = slime.walk_images[slime.current_frame]
+                slime.mask = slime.walk_masks[slime.current_frame]
+
+    def update_ground_rects(self):
+        """Caches the rects of all platforms and bases.
+
+        Used by the player to check for ground below. Must be called
+        whenever a platform or base is added or removed.
+        """
+
+        self._platform_rects = [plat.rect for plat in self.platforms]
+        self._base_rects = [base.rect for base in self.bases]
+
     def draw(self):
         """Draw updated objects to the screen.
         """
 
-        self.screen.fill(s.BLACK)
+        # restore what the HUD of the last frame covered
+        for rect in self._hud_rects:
+            self.all_sprites.repaint_rect(rect)
 
-        # draw all sprites
-        self.all_sprites.draw(self.screen)
+        # draw all sprites, only the changed areas are redrawn
+        dirty_rects = self.all_sprites.draw(self.screen)
         self.enemies.draw(self.screen)
         self.viruses.draw(self.screen)
 
+        hud_rects = []
+
         # draw progress bar
-        self.draw_text('Level Progress', 15, s.BLACK, 5, s.HEIGHT - s.BASE_HEIGHT, pos='top-left')
-        pygame.draw.rect(self.screen, s.RED, (0, s.HEIGHT - 10, s.WIDTH, 10))
+        hud_rects.append(self.draw_text('Level Progress', 15, s.BLACK, 5, s.HEIGHT - s.BASE_HEIGHT, pos='top-left'))
+        hud_rects.append(pygame.draw.rect(self.screen, s.RED, (0, s.HEIGHT - 10, s.WIDTH, 10)))
         pygame.draw.rect(self.screen, s.GREEN, (0, s.HEIGHT - 10, self.platforms_crossed * 10, 10))
 
         # draw game info
-        self.draw_text(f'Level: {self.level}', 22, s.WHITE, s.WIDTH / 2, 20)
+        hud_rects.append(self.draw_text(f'Level: {self.level}', 22, s.WHITE, s.WIDTH / 2, 20))
 
-        self.draw_text(f'Player lives remaining: {self.player.lives}', 22, s.RED, 5, 15, pos='top-left')
+        hud_rects.append(self.draw_text(f'Player lives remaining: {self.player.lives}', 22, s.RED, 5, 15, pos='top-left'))
 
-        self.draw_text(f'Score: {self.score}', 22, s.GREEN, 10, 20, pos='top-right')
-        self.draw_text(f'Bullets: {self.n_bullets}', 22, s.GREEN, 10, 40, pos='top-right')
+        hud_rects.append(self.draw_text(f'Score: {self.score}', 22, s.GREEN, 10, 20, pos='top-right'))
+        hud_rects.append(self.draw_text(f'Bullets: {self.n_bullets}', 22, s.GREEN, 10, 40, pos='top-right'))
 
         # dynamically update color for texts
         if self.vaccines_collected < s.VAC_COLLECT:
@@ -453,10 +602,11 @@ class CoronaBreakout:
         else:
             enem_color = s.GREEN
 
-        self.draw_text(f'Total Vaccines collected: {self.vaccines_collected} / {s.VAC_COLLECT}', 22, vac_color, 5, 45, pos='top-left')
-        self.draw_text(f'Total enemies killed: {self.enemies_killed} / {s.ENEMY_KILLS}', 22, enem_color, 5, 75, pos='top-left')
+        hud_rects.append(self.draw_text(f'Total Vaccines collected: {self.vaccines_collected} / {s.VAC_COLLECT}', 22, vac_color, 5, 45, pos='top-left'))
+        hud_rects.append(self.draw_text(f'Total enemies killed: {self.enemies_killed} / {s.ENEMY_KILLS}', 22, enem_color, 5, 75, pos='top-left'))
 
-        pygame.display.update()
+        self._hud_rects = hud_rects
+        pygame.display.update(dirty_rects + hud_rects)
 
     def show_start_screen(self):
         """Start screen of the game.
@@ -521,6 +671,14 @@ class CoronaBreakout:
         self.wait_for_key(pygame.K_ESCAPE)
         self.paused = False
 
+        # the pause screen covered everything
+        self.all_sprites.repaint_rect(self.screen.get_rect())
+
+        # movement keys may have been released while paused
+        keys = pygame.key.get_pressed()
+        self.key_left = bool(keys[pygame.K_LEFT])
+        self.key_right = bool(keys[pygame.K_RIGHT])
+
     def show_mission_screen(self):
         """Mission screen.
 
@@ -584,6 +742,9 @@ class CoronaBreakout:
             y (int): y coordinate of the text.
             pos (str): Position of the text, for alignment. Defaults to center.
                 Can be of either 'center', 'top-left', 'top-right'
+
+        Returns:
+            text_rect (pygame.Rect): area of the screen covered by the text.
         """
 
         font = pygame.font.Font(self.font_name, size)
@@ -604,6 +765,8 @@ class CoronaBreakout:
 
         self.screen.blit(text_surface, text_rect)
 
+        return text_rect
+
     def show_intro_scene(self):
         """Renders a comic strip storyboard.
 
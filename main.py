@@ -1,6 +1,11 @@
-import pygame
-import settings as s
-from game import CoronaBreakout
+import os
+
+# let pygame 2 use the SDL2 alpha blitter, ignored by older versions
+os.environ.setdefault('PYGAME_BLEND_ALPHA_SDL2', '1')
+
+import pygame  # noqa: E402
+import settings as s  # noqa: E402
+from game import CoronaBreakout  # noqa: E402
 
 if __name__ == '__main__':
     # initializing an instance of the game.
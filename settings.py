@@ -12,6 +12,7 @@ HS_FILE = 'highscore.txt'
 BASE_HEIGHT = 35
 POWERUP_SPAWN_FREQ = 80
 CLOUD_FREQ = 1
+CLOUD_SCALES = (0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
 BULLET_SHOOT_FREQ = 1000
 VAC_COLLECT = 10
 ENEMY_KILLS = 20
@@ -54,6 +55,7 @@ PLAT_SPRITESHEET = os.path.join('platforms', 'platforms_spritesheet.png')
 PLAYER_IDLE = os.path.join('player', 'Idle')
 PLAYER_JUMP = os.path.join('player', 'Jump')
 PLAYER_RUN = os.path.join('player', 'Run')
+PLAYER_ANIMS = (PLAYER_IDLE, PLAYER_JUMP, PLAYER_RUN)
 
 # colors
 WHITE = (255, 255, 255)
@@ -3,7 +3,93 @@ import pygame
 import random
 import settings as s
 
-vec = pygame.math.Vector2
+
+def load_img(filename, scale=1.0, colorkey=s.BLACK, alpha=False):
+    """Loads an image, ready to be blitted.
+
+    The colorkey is set once here, images must not be keyed again later.
+
+    Args:
+        filename (str or pygame.Surface): Filename of the image to be
+            loaded, or an image that is already loaded.
+        scale (float or tuple, optional): scale factor, or size of the
+            scaled image. Defaults to 1.0
+        colorkey (tuple, optional): color to be made transparent, None
+            for no colorkey. Defaults to black.
+        alpha (bool, optional): whether to keep per pixel alpha.
+            Defaults to False
+
+    Returns:
+        image (pygame.Surface): a scaled, converted image.
+    """
+
+    if isinstance(filename, pygame.Surface):
+        image = filename
+    else:
+        image = pygame.image.load(filename)
+
+    if isinstance(scale, tuple):
+        image = pygame.transform.scale(image, scale)
+    elif scale != 1.0:
+        rect = image.get_rect()
+        image = pygame.transform.scale(image, (int(rect.width * scale),
+                                               int(rect.height * scale)))
+
+    if colorkey is not None:
+        image.set_colorkey(colorkey)
+
+    if alpha:
+        return image.convert_alpha()
+
+    return image.convert()
+
+
+def _integrate(pos_x, pos_y, vel_x, vel_y, key_left, key_right, min_x, grav, acc, fric):
+    """Moves the player by one frame.
+
+    Applies friction, key acceleration and gravity, then integrates
+    with t = 1. Pure float math, kept apart from pygame.
+
+    Args:
+        pos_x (float): x coordinate of the player's midbottom.
+        pos_y (float): y coordinate of the player's midbottom.
+        vel_x (float): x velocity.
+        vel_y (float): y velocity.
+        key_left (bool): whether the left key is pressed.
+        key_right (bool): whether the right key is pressed.
+        min_x (float): smallest allowed pos_x.
+        grav (float): gravity.
+        acc (float): acceleration added by a pressed key.
+        fric (float): friction factor.
+
+    Returns:
+        state (tuple): new pos_x, pos_y, vel_x, vel_y.
+    """
+
+    # apply friction
+    acc_x = vel_x * fric * -1
+
+    # add acceleration if key is pressed
+    if key_left:
+        acc_x -= acc
+    elif key_right:
+        acc_x += acc
+
+    # v = u + at | t = 1
+    vel_x += acc_x
+    vel_y += grav
+    # if vel is very low, stop movement.
+    if -0.1 < vel_x < 0.1:
+        vel_x = 0.0
+
+    # x = ut + 0.5 * at**2 | t = 1
+    pos_x += vel_x + 0.5 * acc_x
+    pos_y += vel_y + 0.5 * grav
+
+    if pos_x < min_x:
+        pos_x = min_x
+
+    return pos_x, pos_y, vel_x, vel_y
 
 
 class SpriteSheet:
@@ -18,10 +104,15 @@ class SpriteSheet:
         """
 
         self.spritesheet = pygame.image.load(filename).convert()
+        self._cache = {}  # scaled images, keyed by (x, y, width, height, scale)
 
     def get_image(self, x, y, width, height, scale=0.5):
         """Grabs a smaller image from the larger spritesheet.
 
+        Images are cached, so the same image is returned for the same
+        arguments. It must not be modified by the caller. Parts of the
+        rect outside the spritesheet come out black.
+
         Args:
             x (int): x coordinate of the image.
             y (int): y coordinate of the image.
@@ -31,18 +122,29 @@ class SpriteSheet:
                 Defaults to 0.5
 
         Returns:
-            image (pygame.Surface): a scaled image.
+            image (pygame.Surface): a scaled image, with black as colorkey.
         """
 
-        image = pygame.Surface((width, height))
-        image.blit(self.spritesheet, (0, 0), (x, y, width, height))
-        image = pygame.transform.scale(image, (int(width * scale),
-                                               int(height * scale)))
+        key = (x, y, width, height, scale)
+        image = self._cache.get(key)
+
+        if image is None:
+            rect = pygame.Rect(x, y, width, height)
+            if self.spritesheet.get_rect().contains(rect):
+                sub = self.spritesheet.subsurface(rect)
+            else:  # overruns the sheet, clip it like a blit does
+                sub = pygame.Surface((width, height))
+                sub.blit(self.spritesheet, (0, 0), rect)
+            image = pygame.transform.scale(sub, (int(width * scale),
+                                                 int(height * scale)))
+            image.set_colorkey(s.BLACK)
+            image = image.convert()
+            self._cache[key] = image
 
         return image
 
 
-class Cloud(pygame.sprite.Sprite):
+class Cloud(pygame.sprite.DirtySprite):
 
     def __init__(self, game):
         """Initializing a Cloud sprite.
@@ -56,25 +158,13 @@ class Cloud(pygame.sprite.Sprite):
         super(Cloud, self).__init__(groups)
 
         self.game = game
-        self.image = random.choice(self.game.cloud_images)
-        self.image.set_colorkey(s.BLACK)
+        self.image = random.choice(self.game.cloud_variants)
         self.rect = self.image.get_rect()
-        scale = random.randrange(50, 101) / 100
-        self.image = pygame.transform.scale(self.image, (int(self.rect.width * scale),
-                                                         int(self.rect.height * scale)))
         self.rect.x = random.randrange(s.WIDTH, s.WIDTH + self.rect.width)
         self.rect.y = random.randrange(0, s.HEIGHT - 350)
 
-    def update(self):
-        """Updates sprite.
 
-        Kills the sprite if out of screen.
-        """
-        if self.rect.right < 0:
-            self.kill()
-
-
-class Platform(pygame.sprite.Sprite):
+class Platform(pygame.sprite.DirtySprite):
 
     def __init__(self, game, x, y):
         """Initializing a platform sprite.
@@ -91,39 +181,9 @@ class Platform(pygame.sprite.Sprite):
 
         self.game = game
 
-        if self.game.level == 1:  # stone platforms
-            images = [
-                self.game.plat_spritesheet.get_image(0, 96, 380, 94),
-                self.game.plat_spritesheet.get_image(0, 192, 380, 94),
-                self.game.plat_spritesheet.get_image(382, 408, 200, 100),
-                self.game.plat_spritesheet.get_image(232, 1288, 200, 100),
-            ]
-        elif self.game.level == 2:  # rock platforms
-            images = [
-                self.game.plat_spritesheet.get_image(0, 960, 380, 94),
-                self.game.plat_spritesheet.get_image(0, 864, 380, 94),
-                self.game.plat_spritesheet.get_image(218, 1558, 200, 100),
-                self.game.plat_spritesheet.get_image(382, 0, 200, 100),
-            ]
-        elif self.game.level == 3:  # grass platforms
-            images = [
-                self.game.plat_spritesheet.get_image(0, 288, 380, 94),
-                self.game.plat_spritesheet.get_image(0, 384, 380, 94),
-                self.game.plat_spritesheet.get_image(213, 1662, 201, 100),
-                self.game.plat_spritesheet.get_image(382, 204, 200, 100),
-            ]
-        else:  # snow platforms
-            images = [
-                self.game.plat_spritesheet.get_image(0, 768, 380, 94),
-                self.game.plat_spritesheet.get_image(0, 480, 380, 94),
-                self.game.plat_spritesheet.get_image(213, 1764, 201, 100),
-                self.game.plat_spritesheet.get_image(384, 306, 200, 100),
-            ]
-
-        # load a random image
-        self.image = random.choice(images)
-
-        self.image.set_colorkey(s.BLACK)
+        # pick a random image of the current level
+        self.image = random.choice(self.game.platform_imgs)
+
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
@@ -142,7 +202,7 @@ class Platform(pygame.sprite.Sprite):
             PowerUp(self.game, self, type_=random_type)
 
 
-class Base(pygame.sprite.Sprite):
+class Base(pygame.sprite.DirtySprite):
 
     def __init__(self, game, x):
         """Initializing a Base sprite.
@@ -158,13 +218,12 @@ class Base(pygame.sprite.Sprite):
 
         self.game = game
         self.image = self.game.base_img
-        self.image.set_colorkey(s.BLACK)
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = s.HEIGHT - s.BASE_HEIGHT
 
 
-class Player(pygame.sprite.Sprite):
+class Player(pygame.sprite.DirtySprite):
 
     def __init__(self, game):
         """Initializing player.
@@ -176,6 +235,7 @@ class Player(pygame.sprite.Sprite):
         self._layer = s.PLAYER_LAYER
         groups = game.all_sprites
         super(Player, self).__init__(groups)
+        self.dirty = 2  # redrawn every frame
 
         self.game = game
         self.idle = True
@@ -192,61 +252,59 @@ class Player(pygame.sprite.Sprite):
         self.load_images()
 
         self.image = self.standing_frames_r[0]
+        self.mask = self.masks[self.image]
         self.rect = self.image.get_rect()
         self.rect.center = (20, s.HEIGHT - 50)  # initial pos of player
 
-        self.pos = vec(40, s.HEIGHT - 50)  # position vector
-        self.vel = vec(0, 0)  # velocity vector
-        self.acc = vec(0, 0)  # acceleration vector
+        # position and velocity, kept as plain floats
+        self.pos_x, self.pos_y = 40.0, s.HEIGHT - 50.0
+        self.vel_x, self.vel_y = 0.0, 0.0
 
     def load_images(self):
         """Loads all necessary images for animation.
         """
 
-        # standing / idle frames
-        self.standing_frames_r = []
-        stand_dir = os.path.join(self.game.img_dir, s.PLAYER_IDLE)
-        for image in os.listdir(stand_dir):
-            frame = pygame.image.load(os.path.join(stand_dir, image)).convert()
-            rect = frame.get_rect()
-            frame = pygame.transform.scale(frame, (int(rect.width * 0.2),
-                                                   int(rect.height * 0.2)))
-            frame.set_colorkey(s.BLACK)
-            self.standing_frames_r.append(frame)
-
-        self.standing_frames_l = []
-        for frame in self.standing_frames_r:  # flip x, and not y
-            self.standing_frames_l.append(pygame.transform.flip(frame, True, False))
-
-        # jumping frames
-        self.jumping_frames_r = []
-        jump_dir = os.path.join(self.game.img_dir, s.PLAYER_JUMP)
-        for image in os.listdir(jump_dir):
-            frame = pygame.image.load(os.path.join(jump_dir, image)).convert()
-            rect = frame.get_rect()
-            frame = pygame.transform.scale(frame, (int(rect.width * 0.2),
-                                                   int(rect.height * 0.2)))
-            frame.set_colorkey(s.BLACK)
-            self.jumping_frames_r.append(frame)
-
-        self.jumping_frames_l = []
-        for frame in self.jumping_frames_r:  # flip x, and not y
-            self.jumping_frames_l.append(pygame.transform.flip(frame, True, False))
-
-        # run frames
-        self.run_frames_r = []
-        run_dir = os.path.join(self.game.img_dir, s.PLAYER_RUN)
-        for image in os.listdir(run_dir):
-            frame = pygame.image.load(os.path.join(run_dir, image)).convert()
-            rect = frame.get_rect()
-            frame = pygame.transform.scale(frame, (int(rect.width * 0.2),
-                                                   int(rect.height * 0.2)))
-            frame.set_colorkey(s.BLACK)
-            self.run_frames_r.append(frame)
-
-        self.run_frames_l = []
-        for frame in self.run_frames_r:  # flip x, and not y
-            self.run_frames_l.append(pygame.transform.flip(frame, True, False))
+        # collision masks and rects of every frame, keyed by frame
+        self.masks = {}
+        self.rects = {}
+
+        self.standing_frames_r, self.standing_frames_l = self._load_anim(s.PLAYER_IDLE)
+        self.jumping_frames_r, self.jumping_frames_l = self._load_anim(s.PLAYER_JUMP)
+        self.run_frames_r, self.run_frames_l = self._load_anim(s.PLAYER_RUN)
+
+    def _load_anim(self, subdir, scale=0.2):
+        """Loads the frames of a single animation.
+
+        The collision mask and rect of every frame are stored in
+        self.masks and self.rects. Frames already preloaded by the game
+        are not read from disk again.
+
+        Args:
+            subdir (str): Directory of the frames, relative to img_dir.
+                Must be listed in the game's asset manifest.
+            scale (float, optional): scale factor between 0 and 1.
+                Defaults to 0.2
+
+        Returns:
+            frames (tuple): right facing frames, left facing frames.
+        """
+
+        paths = self.game.asset_manifest[subdir]
+
+        right = [None] * len(paths)
+        # frames already have per pixel alpha, no colorkey needed
+        for i, path in enumerate(paths):
+            image = self.game._preloaded.get(path, path)
+            right[i] = load_img(image, scale, colorkey=None, alpha=True)
+
+        right = tuple(right)
+        left = tuple(pygame.transform.flip(frame, True, False).convert_alpha() for frame in right)  # flip x, and not y
+
+        for frame in right + left:
+            self.masks[frame] = pygame.mask.from_surface(frame)
+            self.rects[frame] = frame.get_rect()
+
+        return right, left
 
     def jump(self):
         """Jumps the player.
@@ -254,18 +312,25 @@ class Player(pygame.sprite.Sprite):
         Jumps only if player is on platform, to avoid double jumping.
         """
 
-        self.rect.x += 2  # see upto 2 pixels below
-        plat_hits = pygame.sprite.spritecollide(self, self.game.platforms, False)  # don't kill
-        base_hits = pygame.sprite.spritecollide(self, self.game.bases, False)
-        self.rect.x -= 2
-
-        hits = plat_hits or base_hits
-
-        if hits and not self.jumping:
+        if self._on_ground() and not self.jumping:
             self.game.jump_sound.play()
             self.jumping = True
             self.idle = False
-            self.vel.y = s.PLAYER_JUMP_VEL * -1
+            self.vel_y = s.PLAYER_JUMP_VEL * -1
+
+    def _on_ground(self):
+        """Checks if the player is touching a platform or base.
+
+        Returns:
+            bool: True if a platform or base is hit.
+        """
+
+        probe = self.rect.move(2, 0)  # see upto 2 pixels below
+
+        plat_hit = probe.collidelist(self.game._platform_rects) != -1
+        base_hit = probe.collidelist(self.game._base_rects) != -1
+
+        return plat_hit or base_hit
 
     def jump_cut(self):
         """Stop the jump if key is released.
@@ -275,8 +340,8 @@ class Player(pygame.sprite.Sprite):
         """
 
         if self.jumping:
-            if self.vel.y < s.JUMP_THRESHOLD * -1:
-                self.vel.y = s.JUMP_THRESHOLD * -1
+            if self.vel_y < s.JUMP_THRESHOLD * -1:
+                self.vel_y = s.JUMP_THRESHOLD * -1
 
     def update(self):
         """Update attributes of the player.
@@ -286,39 +351,24 @@ class Player(pygame.sprite.Sprite):
 
         self.animate()
 
-        # apply gravity to player
-        self.acc = vec(0, s.PLAYER_GRAV)
-
-        keys = pygame.key.get_pressed()
+        # prevent the player from going towards the left
+        min_x = self.rect.width / 2
 
-        # add acceleration if key is pressed
-        if keys[pygame.K_LEFT]:
-            self.acc.x = s.PLAYER_ACC * -1
-        elif keys[pygame.K_RIGHT]:
-            self.acc.x = s.PLAYER_ACC
-
-        # apply friction
-        self.acc.x += self.vel.x * s.PLAYER_FRICTION * -1
-
-        # v = u + at | t = 1
-        self.vel += self.acc
-        # if vel is very low, stop movement.
-        if abs(self.vel.x) < 0.1:
-            self.vel.x = 0
-
-        # x = ut + 0.5 * at**2 | t = 1
-        self.pos += self.vel + 0.5 * self.acc
+        self.pos_x, self.pos_y, self.vel_x, self.vel_y = _integrate(
+            self.pos_x, self.pos_y, self.vel_x, self.vel_y,
+            self.game.key_left, self.game.key_right, min_x,
+            s.PLAYER_GRAV, s.PLAYER_ACC, s.PLAYER_FRICTION)
 
         # update the position of the sprite with calculated pos
-        self.rect.midbottom = self.pos
+        self.rect.midbottom = (int(self.pos_x), int(self.pos_y))
 
     def animate(self):
         """Handles player animation.
         """
 
-        now = pygame.time.get_ticks()
+        now = self.game.now
 
-        if self.vel.x != 0:
+        if self.vel_x != 0:
             self.running = True
             self.idle = False
         else:
@@ -333,12 +383,13 @@ class Player(pygame.sprite.Sprite):
                 self.current_frame = (self.current_frame + 1) % len(self.run_frames_l)
                 bottom = self.rect.bottom
 
-                if self.vel.x > 0:
+                if self.vel_x > 0:
                     self.image = self.run_frames_r[self.current_frame]
                 else:
                     self.image = self.run_frames_l[self.current_frame]
 
-                self.rect = self.image.get_rect()
+                self.mask = self.masks[self.image]
+                self.rect = self.rects[self.image].copy()
                 self.rect.bottom = bottom
 
         # show idle animation
@@ -350,25 +401,25 @@ class Player(pygame.sprite.Sprite):
                 bottom = self.rect.bottom
                 # set image
                 self.image = self.standing_frames_r[self.current_frame]
-                self.rect = self.image.get_rect()
+                self.mask = self.masks[self.image]
+                self.rect = self.rects[self.image].copy()
                 self.rect.bottom = bottom
 
         if self.jumping:
             bottom = self.rect.bottom
-            if self.vel.x < 0:
+            if self.vel_x < 0:
                 self.image = self.jumping_frames_l[0]
             else:
                 self.image = self.jumping_frames_r[0]
 
-            self.rect = self.image.get_rect()
+            self.mask = self.masks[self.image]
+            self.rect = self.rects[self.image].copy()
             self.rect.bottom = bottom
 
         # show shooting animation
 
-        self.mask = pygame.mask.from_surface(self.image)
-
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet(pygame.sprite.DirtySprite):
 
     def __init__(self, game):
         """Initialize a bullet sprite.
@@ -382,6 +433,7 @@ class Bullet(pygame.sprite.Sprite):
         self._layer = s.BULLET_LAYER
         groups = game.all_sprites, game.bullets
         super(Bullet, self).__init__(groups)
+        self.dirty = 2  # redrawn every frame
 
         self.game = game
         self.vel = s.BULLET_VEL
@@ -390,7 +442,7 @@ class Bullet(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
 
         # if player moves towards left while shooting
-        if self.game.player.vel.x < 0:
+        if self.game.player.vel_x < 0:
             self.vel *= -1
             self.rect.right = self.game.player.rect.left
         else:
@@ -419,22 +471,24 @@ class Bullet(pygame.sprite.Sprite):
         elif self.rect.right < 0:
             self.kill()
 
-        self.mask = pygame.mask.from_surface(self.image)
-
 
-class Slime(pygame.sprite.Sprite):
+class Slime(pygame.sprite.DirtySprite):
 
     def __init__(self, game, bacteria=False):
         """Initialize an enemy sprite.
 
+        Slimes are moved and animated by the game, in a single loop over
+        game.slimes, see CoronaBreakout.update_slimes.
+
         Args:
             game (game_instance): Game instance.
             bacteria (bool): Whether to render images of bacteria
         """
 
         self.layer = s.ENEMY_LAYER
-        groups = game.all_sprites, game.enemies
+        groups = game.all_sprites, game.enemies, game.slimes
         super(Slime, self).__init__(groups)
+        self.dirty = 2  # redrawn every frame
 
         self.game = game
         self.bacteria = bacteria
@@ -442,68 +496,25 @@ class Slime(pygame.sprite.Sprite):
         self.last_update = 0
         self.load_images()
         self.image = self.walk_images[0]
+        self.mask = self.walk_masks[0]
         self.rect = self.image.get_rect()
         self.rect.left = s.WIDTH
         self.rect.bottom = s.HEIGHT - s.BASE_HEIGHT + 5
         self.vx = random.randrange(1, 4)  # speed
 
     def load_images(self):
-        """Loads images from spritesheet.
-        """
-
-        if not self.bacteria:
-            self.walk_images = [
-                self.game.enemy_spritesheet.get_image(52, 125, 50, 28, scale=1.5),
-                self.game.enemy_spritesheet.get_image(0, 125, 51, 26, scale=1.5)
-            ]
-
-        elif self.bacteria:
-            self.walk_images = [
-                self.game.bac_spritesheet.get_image(0, 0, 32, 31, scale=1.5),
-                self.game.bac_spritesheet.get_image(32, 0, 32, 31, scale=1.5),
-                self.game.bac_spritesheet.get_image(64, 0, 32, 31, scale=1.5),
-                self.game.bac_spritesheet.get_image(0, 31, 32, 31, scale=1.5),
-                self.game.bac_spritesheet.get_image(32, 31, 32, 31, scale=1.5),
-                self.game.bac_spritesheet.get_image(64, 31, 32, 31, scale=1.5),
-                self.game.bac_spritesheet.get_image(0, 62, 32, 31, scale=1.5),
-                self.game.bac_spritesheet.get_image(32, 62, 32, 31, scale=1.5),
-                self.game.bac_spritesheet.get_image(64, 62, 32, 31, scale=1.5),
-                self.game.bac_spritesheet.get_image(0, 93, 32, 31, scale=1.5),
-                self.game.bac_spritesheet.get_image(32, 93, 32, 31, scale=1.5),
-                self.game.bac_spritesheet.get_image(64, 93, 32, 31, scale=1.5),
-            ]
-
-        for frame in self.walk_images:
-            frame.set_colorkey(s.BLACK)
-
-    def update(self):
-        """Update the sprite.
-
-        Animate, Update position, kill if out of screen.
-        """
-
-        self.animate()
-
-        self.rect.x -= self.vx
-
-        if self.rect.right < 0:
-            self.kill()
+        """Picks the shared walking frames and masks.
 
-    def animate(self):
-        """Handles sprite animation.
+        They are loaded once by the game, see CoronaBreakout.load_data.
         """
 
-        now = pygame.time.get_ticks()
-
-        if now - self.last_update > 180:
-            self.last_update = now
-            self.current_frame = (self.current_frame + 1) % len(self.walk_images)
-            self.image = self.walk_images[self.current_frame]
-
-        self.mask = pygame.mask.from_surface(self.image)
+        if self.bacteria:
+            self.walk_images, self.walk_masks = self.game.bacteria_frames
+        else:
+            self.walk_images, self.walk_masks = self.game.slime_frames
 
 
-class Bat(pygame.sprite.Sprite):
+class Bat(pygame.sprite.DirtySprite):
 
     def __init__(self, game, boss=False):
         """Initialize an enemy bat sprite.
@@ -516,6 +527,7 @@ class Bat(pygame.sprite.Sprite):
         self.layer = s.ENEMY_LAYER
         groups = game.all_sprites, game.enemies
         super(Bat, self).__init__(groups)
+        self.dirty = 2  # redrawn every frame
 
         self.game = game
         self.boss = boss
@@ -524,6 +536,7 @@ class Bat(pygame.sprite.Sprite):
         self.spreaded = False
         self.load_images()
         self.image = self.images[0]
+        self.mask = self.masks[0]
         self.rect = self.image.get_rect()
         self.rect.left = s.WIDTH
         self.rect.top = s.HEIGHT * 0.5
@@ -532,23 +545,15 @@ class Bat(pygame.sprite.Sprite):
         self.dy = 0.5
 
     def load_images(self):
-        """Loads images from spritesheet.
-        """
+        """Picks the shared flying frames and masks.
 
-        if not self.boss:
-            self.images = [
-                self.game.enemy_spritesheet.get_image(0, 32, 72, 36, scale=1.5),
-                self.game.enemy_spritesheet.get_image(0, 0, 75, 31, scale=1.5),
-            ]
-
-        elif self.boss:
-            self.images = [
-                self.game.enemy_spritesheet.get_image(0, 32, 72, 36, scale=2),
-                self.game.enemy_spritesheet.get_image(0, 0, 75, 31, scale=2),
-            ]
+        They are loaded once by the game, see CoronaBreakout.load_data.
+        """
 
-        for image in self.images:
-            image.set_colorkey(s.BLACK)
+        if self.boss:
+            self.images, self.masks = self.game.boss_bat_frames
+        else:
+            self.images, self.masks = self.game.bat_frames
 
     def update(self):
         """Update the sprite.
@@ -582,17 +587,16 @@ class Bat(pygame.sprite.Sprite):
         """Handles sprite animation.
         """
 
-        now = pygame.time.get_ticks()
+        now = self.game.now
 
         if now - self.last_update > 180:
             self.last_update = now
             self.current_frame = (self.current_frame + 1) % len(self.images)
             self.image = self.images[self.current_frame]
-
-        self.mask = pygame.mask.from_surface(self.image)
+            self.mask = self.masks[self.current_frame]
 
 
-class Virus(pygame.sprite.Sprite):
+class Virus(pygame.sprite.DirtySprite):
     """Virus that infects player.
 
     Player loses one life, plus becomes hurt??
@@ -612,6 +616,7 @@ class Virus(pygame.sprite.Sprite):
         self.layer = s.ENEMY_LAYER
         groups = game.all_sprites, game.viruses
         super(Virus, self).__init__(groups)
+        self.dirty = 2  # redrawn every frame
 
         self.bat = bat
         self.game = game
@@ -654,7 +659,7 @@ class Virus(pygame.sprite.Sprite):
             self.kill()
 
 
-class PowerUp(pygame.sprite.Sprite):
+class PowerUp(pygame.sprite.DirtySprite):
     """A PowerUp sprite that boosts score.
     """
 
@@ -684,20 +689,15 @@ class PowerUp(pygame.sprite.Sprite):
     def load_image(self):
         """Loads the image.
 
-        Loads, scaled, rotates.
+        Images are shared, and already colorkeyed.
         """
 
         if self.type == 'vaccine':
-            self.image = pygame.image.load(os.path.join(self.game.img_dir, 'syringe.png')).convert()
-            rect = self.image.get_rect()
-            self.image = pygame.transform.scale(self.image, (int(rect.width * 2), int(rect.height * 2)))
-            self.image = pygame.transform.rotate(self.image, 90)
+            self.image = self.game.vaccine_img
         elif self.type == 'health':
-            self.image = self.game.hud_spritesheet.get_image(0, 94, 53, 45, scale=0.5).convert()
+            self.image = self.game.hud_spritesheet.get_image(0, 94, 53, 45, scale=0.5)
         elif self.type == 'ammo':
-            self.image = self.game.plat_spritesheet.get_image(852, 1089, 65, 77, scale=0.5).convert()
-
-        self.image.set_colorkey(s.BLACK)
+            self.image = self.game.plat_spritesheet.get_image(852, 1089, 65, 77, scale=0.5)
 
     def update(self):
         """Update sprite.
@@ -706,13 +706,15 @@ class PowerUp(pygame.sprite.Sprite):
         """
 
         # moving powerup along with platform
-        self.rect.centerx = self.plat.rect.centerx
+        if self.rect.centerx != self.plat.rect.centerx:
+            self.rect.centerx = self.plat.rect.centerx
+            self.dirty = 1
 
         if not self.game.platforms.has(self.plat):
             self.kill()
 
 
-class BackGround(pygame.sprite.Sprite):
+class BackGround(pygame.sprite.DirtySprite):
     """A class for bg images.
 
     Used only for layering functionality.
@@ -734,10 +736,8 @@ class BackGround(pygame.sprite.Sprite):
         bg_dir = os.path.join(self.game.img_dir, 'background')
 
         if self.game.level >= 2:
-            image = pygame.image.load(os.path.join(bg_dir, 'forest.jpg')).convert()
+            self.image = load_img(os.path.join(bg_dir, 'forest.jpg'), (s.WIDTH, s.HEIGHT), colorkey=None)
         else:
-            image = pygame.image.load(os.path.join(bg_dir, 'night_city.png')).convert_alpha()
-            image.set_colorkey(s.BLACK)
+            self.image = load_img(os.path.join(bg_dir, 'night_city.png'), (s.WIDTH, s.HEIGHT), alpha=True)
 
-        self.image = pygame.transform.scale(image, (s.WIDTH, s.HEIGHT))
         self.rect = self.image.get_rect()